@@ -233,6 +233,13 @@ class Dogleg(AbstractGaussNewton[Y, Out, Aux], strict=True):
         Jacobian. Can be either `"fwd"` or `"bwd"`. Defaults to `"fwd"`, which is
         usually more efficient. Changing this can be useful when the target function has
         a `jax.custom_vjp`, and so does not support forward-mode autodifferentiation.
+    - `materialise_jac`: whether to materialise the Jacobian as a (pytree of) dense
+        array(s) when `jac="fwd"`, rather than storing it as a function. (With
+        `jac="bwd"` the Jacobian is always materialised.) Defaults to `False`.
+        Materialising the Jacobian computes it in a single batched pass, and allows the
+        linear solver to use a dense fast-path, which is often faster for
+        small-to-medium problems. (On GPU the dense path dispatches to a single
+        batched cuSolver call per step, rather than many small kernels.)
     """
 
     rtol: float
@@ -2,11 +2,12 @@ from collections.abc import Callable
 from typing import Any, Generic, Literal, Optional, Union
 
 import equinox as eqx
+import equinox.internal as eqxi
 import jax
 import jax.numpy as jnp
+import jax.tree_util as jtu
 import lineax as lx
 from equinox import AbstractVar
-from equinox.internal import ω
 from jaxtyping import Array, Bool, Int, PyTree, Scalar
 
 from .._custom_types import Args, Aux, DescentState, Fn, Out, SearchState, Y
@@ -15,7 +16,6 @@ from .._misc import (
     cauchy_termination,
     filter_cond,
     max_norm,
-    sum_squares,
     tree_full_like,
     verbose_print,
 )
@@ -126,11 +126,12 @@ class NewtonDescent(
         del state
         newton, result = newton_step(f_info, self.linear_solver)
         if self.norm is not None:
-            newton = (newton**ω / self.norm(newton)).ω
+            norm = self.norm(newton)
+            newton = jtu.tree_map(lambda x: x / norm, newton)
         return _NewtonDescentState(newton, result)
 
     def step(self, step_size: Scalar, state: _NewtonDescentState) -> tuple[Y, RESULTS]:
-        return (-step_size * state.newton**ω).ω, state.result
+        return jtu.tree_map(lambda x: -step_size * x, state.newton), state.result
 
 
 NewtonDescent.__init__.__doc__ = """**Arguments:**
@@ -161,6 +162,8 @@ class _GaussNewtonState(
     num_steps: Int[Array, ""]
     num_accepted_steps: Int[Array, ""]
     num_steps_since_acceptance: Int[Array, ""]
+    # Static metadata, computed once in `init` and then reused on every step.
+    in_structure: eqxi.Static
 
 
 def _make_f_info(
@@ -169,12 +172,25 @@ def _make_f_info(
     args: Args,
     tags: frozenset,
     jac: Literal["fwd", "bwd"],
+    materialise: bool,
+    in_structure: eqxi.Static,
 ) -> tuple[FunctionInfo.ResidualJac, Aux]:
     if jac == "fwd":
-        f_eval, lin_fn, aux_eval = jax.linearize(
-            lambda _y: fn(_y, args), y, has_aux=True
-        )
-        jac_eval = lx.FunctionLinearOperator(lin_fn, jax.eval_shape(lambda: y), tags)
+        if materialise:
+            # Materialise the Jacobian, as with `jac="bwd"` below, but using a single
+            # batched forward-mode pass.
+            def _for_jacfwd(_y):
+                f_eval, aux_eval = fn(_y, args)
+                return f_eval, (f_eval, aux_eval)
+
+            jac_pytree, (f_eval, aux_eval) = jax.jacfwd(_for_jacfwd, has_aux=True)(y)
+            output_structure = jax.eval_shape(lambda: f_eval)
+            jac_eval = lx.PyTreeLinearOperator(jac_pytree, output_structure, tags)
+        else:
+            f_eval, lin_fn, aux_eval = jax.linearize(
+                lambda _y: fn(_y, args), y, has_aux=True
+            )
+            jac_eval = lx.FunctionLinearOperator(lin_fn, in_structure.value, tags)
     elif jac == "bwd":
         # Materialise the Jacobian in this case.
         def _for_jacrev(_y):
@@ -212,6 +228,13 @@ class AbstractGaussNewton(
         Jacobian. Can be either `"fwd"` or `"bwd"`. Defaults to `"fwd"`, which is
         usually more efficient. Changing this can be useful when the target function has
         a `jax.custom_vjp`, and so does not support forward-mode autodifferentiation.
+    - `materialise_jac`: whether to materialise the Jacobian as a (pytree of) dense
+        array(s) when `jac="fwd"`, rather than storing it as a function. (With
+        `jac="bwd"` the Jacobian is always materialised.) Defaults to `False`.
+        Materialising the Jacobian computes it in a single batched pass, and allows the
+        linear solver to use a dense fast-path, which is often faster for
+        small-to-medium problems. (On GPU the dense path dispatches to a single
+        batched cuSolver call per step, rather than many small kernels.)
     """
 
     rtol: AbstractVar[float]
@@ -234,7 +257,11 @@ class AbstractGaussNewton(
         tags: frozenset[object],
     ) -> _GaussNewtonState:
         jac = options.get("jac", "fwd")
-        f_info_struct, _ = eqx.filter_eval_shape(_make_f_info, fn, y, args, tags, jac)
+        materialise = options.get("materialise_jac", False)
+        in_structure = eqxi.Static(jax.eval_shape(lambda: y))
+        f_info_struct, _ = eqx.filter_eval_shape(
+            _make_f_info, fn, y, args, tags, jac, materialise, in_structure
+        )
         f_info = tree_full_like(f_info_struct, 0, allow_static=True)
         return _GaussNewtonState(
             first_step=jnp.array(True),
@@ -248,6 +275,7 @@ class AbstractGaussNewton(
             num_steps=jnp.array(0),
             num_accepted_steps=jnp.array(0),
             num_steps_since_acceptance=jnp.array(0),
+            in_structure=in_structure,
         )
 
     def step(
@@ -260,7 +288,10 @@ class AbstractGaussNewton(
         tags: frozenset[object],
     ) -> tuple[Y, _GaussNewtonState, Aux]:
         jac = options.get("jac", "fwd")
-        f_eval_info, aux_eval = _make_f_info(fn, state.y_eval, args, tags, jac)
+        materialise = options.get("materialise_jac", False)
+        f_eval_info, aux_eval = _make_f_info(
+            fn, state.y_eval, args, tags, jac, materialise, state.in_structure
+        )
         # We have a jaxpr in `f_info.jac`, which are compared by identity. Here we
         # arrange to use the same one so that downstream equality checks (e.g. in the
         # `filter_cond` below)
@@ -285,8 +316,10 @@ class AbstractGaussNewton(
 
         def accepted(descent_state):
             descent_state = self.descent.query(state.y_eval, f_eval_info, descent_state)
-            y_diff = (state.y_eval**ω - y**ω).ω
-            f_diff = (f_eval_info.residual**ω - state.f_info.residual**ω).ω
+            y_diff = jtu.tree_map(lambda a, b: a - b, state.y_eval, y)
+            f_diff = jtu.tree_map(
+                lambda a, b: a - b, f_eval_info.residual, state.f_info.residual
+            )
             terminate = cauchy_termination(
                 self.rtol,
                 self.atol,
@@ -311,8 +344,8 @@ class AbstractGaussNewton(
             verbose_accepted = "accepted" in self.verbose
             verbose_step_size = "step_size" in self.verbose
             verbose_y = "y" in self.verbose
-            loss_eval = 0.5 * sum_squares(f_eval_info.residual)
-            loss = 0.5 * sum_squares(state.f_info.residual)
+            loss_eval = f_eval_info.as_min()
+            loss = state.f_info.as_min()
             verbose_print(
                 (verbose_step, "Step", state.num_steps),
                 (
@@ -337,7 +370,7 @@ class AbstractGaussNewton(
             )
 
         y_descent, descent_result = self.descent.step(step_size, descent_state)
-        y_eval = (y**ω + y_descent**ω).ω
+        y_eval = jtu.tree_map(lambda a, b: a + b, y, y_descent)
         result = RESULTS.where(
             search_result == RESULTS.successful, descent_result, search_result
         )
@@ -354,6 +387,7 @@ class AbstractGaussNewton(
             num_steps=num_steps,
             num_accepted_steps=num_accepted_steps,
             num_steps_since_acceptance=num_steps_since_acceptance,
+            in_structure=state.in_structure,
         )
         return y, state, aux
 
@@ -394,6 +428,13 @@ class GaussNewton(AbstractGaussNewton[Y, Out, Aux], strict=True):
         Jacobian. Can be either `"fwd"` or `"bwd"`. Defaults to `"fwd"`, which is
         usually more efficient. Changing this can be useful when the target function has
         a `jax.custom_vjp`, and so does not support forward-mode autodifferentiation.
+    - `materialise_jac`: whether to materialise the Jacobian as a (pytree of) dense
+        array(s) when `jac="fwd"`, rather than storing it as a function. (With
+        `jac="bwd"` the Jacobian is always materialised.) Defaults to `False`.
+        Materialising the Jacobian computes it in a single batched pass, and allows the
+        linear solver to use a dense fast-path, which is often faster for
+        small-to-medium problems. (On GPU the dense path dispatches to a single
+        batched cuSolver call per step, rather than many small kernels.)
     """
 
     rtol: float
@@ -427,7 +468,13 @@ GaussNewton.__init__.__doc__ = """**Arguments:**
     convergence criteria. Should be any function `PyTree -> Scalar`. Optimistix
     includes three built-in norms: [`optimistix.max_norm`][],
     [`optimistix.rms_norm`][], and [`optimistix.two_norm`][].
-- `linear_solver`: The linear solver used to compute the Newton step.
+- `linear_solver`: The linear solver used to compute the Newton step. Defaults to
+    `lx.AutoLinearSolver(well_posed=None)`, which is safe for ill-posed problems. For
+    strongly overdetermined problems (many more residuals than parameters), passing
+    `lx.NormalCG(rtol, atol)` instead will solve the normal equations `J^T J x = J^T r`
+    iteratively, which avoids an expensive QR/SVD factorisation of the full Jacobian.
+    (At the price of squaring the condition number, so this is only recommended for
+    well-conditioned problems.)
 - `verbose`: Whether to print out extra information about how the solve is proceeding.
     Should be a frozenset of strings, specifying what information to print out. Valid
     entries are `step`, `loss`, `accepted`, `step_size`, `y`. For example
@@ -88,13 +88,15 @@ class _AbstractNewtonChord(
             init_later_state = lax.stop_gradient(init_later_state)
             linear_state = (jac, init_later_state)
         if self.cauchy_termination:
-            f_val = tree_full_like(f_struct, jnp.inf)
+            # Dummy value; the termination check is skipped before the first step, so
+            # we can avoid materialising a tree of infinities here.
+            f_val = tree_full_like(f_struct, 0)
         else:
             f_val = None
         return _NewtonChordState(
             f=f_val,
             linear_state=linear_state,
-            diff=tree_full_like(y, jnp.inf),
+            diff=tree_full_like(y, 0),
             diffsize=jnp.array(jnp.inf),
             diffsize_prev=jnp.array(1.0),
             result=RESULTS.successful,
@@ -176,6 +178,9 @@ class _AbstractNewtonChord(
                 jtu.tree_map(jnp.zeros_like, state.f),
                 state.f,
             )
+            # `state.f` and `state.diff` hold dummy values until the first step has
+            # happened.
+            terminate = (state.step >= 1) & terminate
             terminate_result = RESULTS.successful
         else:
             # TODO(kidger): perform only one iteration when solving a linear system!
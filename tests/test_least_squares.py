@@ -151,6 +151,41 @@ def test_gauss_newton_jacrev():
         optx.least_squares(f, solver, y0, options=dict(jac="fwd"), max_steps=512)
 
 
+@pytest.mark.parametrize(
+    "solver",
+    (
+        optx.GaussNewton(rtol=1e-8, atol=1e-8),
+        optx.LevenbergMarquardt(rtol=1e-8, atol=1e-8),
+    ),
+)
+def test_gauss_newton_materialised_jac(solver):
+    def f(y, _):
+        return dict(bar=jnp.exp(y["foo"]) - 1)
+
+    y0 = dict(foo=jnp.arange(3.0))
+    out = optx.least_squares(
+        f, solver, y0, options=dict(materialise_jac=True), max_steps=512
+    )
+    assert tree_allclose(out.value, dict(foo=jnp.zeros(3)), rtol=1e-3, atol=1e-2)
+
+
+def test_least_squares_vmap():
+    # Many small independent problems, solved in a single batched call.
+    def fn(y, args):
+        return y**3 - args
+
+    solver = optx.GaussNewton(rtol=1e-8, atol=1e-8)
+
+    @jax.vmap
+    def solve(y0, args):
+        return optx.least_squares(fn, solver, y0, args=args, max_steps=256).value
+
+    y0 = jnp.ones((5, 3))
+    args = jnp.linspace(1.0, 2.0, 15).reshape(5, 3)
+    out = solve(y0, args)
+    assert tree_allclose(out, jnp.cbrt(args), rtol=1e-4, atol=1e-4)
+
+
 def test_residual_jac():
     # We have a `.compute_grad_dot(vec)` method, which computes `grad^T vec`. If you did
     # this naively this would require reverse-mode autodiff.